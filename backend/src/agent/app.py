@@ -1,6 +1,7 @@
 # mypy: disable - error - code = "no-untyped-def,misc"
 import pathlib
 from fastapi import FastAPI, Response
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 
 # Define the FastAPI app
@@ -38,8 +39,10 @@ def create_frontend_router(build_dir="../frontend/dist"):
 
 
 # Mount the frontend under /app to not conflict with the LangGraph API routes
+# Only the frontend mount is gzipped; this app also wraps the LangGraph API routes,
+# whose event streams must not be buffered by compression
 app.mount(
     "/app",
-    create_frontend_router(),
+    GZipMiddleware(create_frontend_router(), minimum_size=1000, compresslevel=5),
     name="frontend",
 )